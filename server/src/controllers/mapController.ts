@@ -1,5 +1,14 @@
 import { Request, Response } from 'express';
-import { StatesMapRequestSchema, MapExportResult, StatesMapResponse, ErrorResponse } from '../types/index.js';
+import {
+  StatesMapRequestSchema,
+  StatesMapsRequestSchema,
+  StatesMetadataRequestSchema,
+  MapExportResult,
+  StatesMapResponse,
+  StatesMapsResponse,
+  StatesMetadataResponse,
+  ErrorResponse
+} from '../types/index.js';
 import { StatesMapRenderer } from '../services/mapRenderer.js';
 import { ExportService } from '../services/exportService.js';
 import { ZodError } from 'zod';
@@ -46,42 +55,90 @@ export class MapController {
       const svgString = await this.renderer.renderMap(validatedRequest);
 
       // Generate requested formats
-      const exports: MapExportResult[] = [];
-
-      for (const format of validatedRequest.formats || ['png']) {
-        let base64Data: string;
-
-        switch (format) {
-          case 'png':
-            base64Data = await this.exportService.svgToPNG(svgString);
-            break;
-          case 'svg':
-            base64Data = await this.exportService.svgToBase64(svgString);
-            break;
-          case 'pdf':
-            base64Data = await this.exportService.svgToPDF(svgString);
-            break;
-          default:
-            continue;
+      const exports = await this.buildExports(svgString, validatedRequest.formats);
+
+      // Prepare response
+      const response: StatesMapResponse = {
+        success: true,
+        exports,
+        metadata: {
+          dataPoints: validatedRequest.data.length,
+          colorScale: validatedRequest.colorScale || 'spectral',
+          minValue,
+          maxValue,
+          meanValue
         }
+      };
+
+      res.json(response);
+    } catch (error) {
+      this.handleError(error, res);
+    }
+  }
+
+  /**
+   * Generate one states map per render entry from a single dataset.
+   * Validation and statistics are computed once and shared by every render.
+   */
+  async generateStatesMaps(req: Request, res: Response): Promise<void> {
+    try {
+      const { renders, ...baseRequest } = StatesMapsRequestSchema.parse(req.body);
+
+      const values = baseRequest.data.map(d => d.value);
+      const minValue = Math.min(...values);
+      const maxValue = Math.max(...values);
+      const meanValue = values.reduce((a, b) => a + b, 0) / values.length;
 
-        exports.push({
-          format,
-          data: base64Data,
-          mimeType: this.exportService.getMimeType(format)
+      const maps: StatesMapsResponse['maps'] = [];
+
+      for (const render of renders) {
+        const colorScale = render.colorScale ?? baseRequest.colorScale;
+        const svgString = await this.renderer.renderMap({
+          ...baseRequest,
+          colorScale,
+          mainTitle: render.mainTitle ?? baseRequest.mainTitle
         });
 
-        // Explicitly null the base64Data to allow GC to reclaim memory
-        base64Data = '';
+        maps.push({
+          colorScale,
+          exports: await this.buildExports(svgString, baseRequest.formats)
+        });
       }
 
-      // Prepare response
-      const response: StatesMapResponse = {
+      const response: StatesMapsResponse = {
+        success: true,
+        maps,
+        metadata: {
+          dataPoints: baseRequest.data.length,
+          minValue,
+          maxValue,
+          meanValue
+        }
+      };
+
+      res.json(response);
+    } catch (error) {
+      this.handleError(error, res);
+    }
+  }
+
+  /**
+   * Compute dataset statistics only, without rendering or exporting a map
+   */
+  async getStatesMetadata(req: Request, res: Response): Promise<void> {
+    try {
+      const validatedRequest = StatesMetadataRequestSchema.parse(req.body);
+
+      const values = validatedRequest.data.map(d => d.value);
+      const minValue = Math.min(...values);
+      const maxValue = Math.max(...values);
+      const meanValue = values.reduce((a, b) => a + b, 0) / values.length;
+
+      const response: StatesMetadataResponse = {
         success: true,
-        exports,
         metadata: {
           dataPoints: validatedRequest.data.length,
-          colorScale: validatedRequest.colorScale || 'spectral',
+          colorScale: validatedRequest.colorScale,
           minValue,
           maxValue,
           meanValue
@@ -94,6 +151,45 @@ export class MapController {
     }
   }
 
+  /**
+   * Convert a rendered SVG into the requested export formats
+   */
+  private async buildExports(
+    svgString: string,
+    formats: MapExportResult['format'][] = ['png']
+  ): Promise<MapExportResult[]> {
+    const exports: MapExportResult[] = [];
+
+    for (const format of formats) {
+      let base64Data: string;
+
+      switch (format) {
+        case 'png':
+          base64Data = await this.exportService.svgToPNG(svgString);
+          break;
+        case 'svg':
+          base64Data = await this.exportService.svgToBase64(svgString);
+          break;
+        case 'pdf':
+          base64Data = await this.exportService.svgToPDF(svgString);
+          break;
+        default:
+          continue;
+      }
+
+      exports.push({
+        format,
+        data: base64Data,
+        mimeType: this.exportService.getMimeType(format)
+      });
+
+      // Explicitly null the base64Data to allow GC to reclaim memory
+      base64Data = '';
+    }
+
+    return exports;
+  }
+
   /**
    * Handle errors and send appropriate response
    */
@@ -1,7 +1,7 @@
 import express from 'express';
 import cors from 'cors';
 import helmet from 'helmet';
-import rateLimit from 'express-rate-limit';
+import rateLimit, { MemoryStore } from 'express-rate-limit';
 import { randomUUID } from 'crypto';
 import { fileURLToPath } from 'url';
 import { dirname, join } from 'path';
@@ -47,16 +47,40 @@ app.use(cors({
   credentials: false
 }));
 
+const RATE_LIMIT_MAX = 100;
+const RATE_LIMIT_MESSAGE = 'Too many requests from this IP, please try again later.';
+const rateLimitStore = new MemoryStore();
+
 const limiter = rateLimit({
   windowMs: 15 * 60 * 1000,
-  max: 100,
-  message: 'Too many requests from this IP, please try again later.',
+  max: RATE_LIMIT_MAX,
+  message: RATE_LIMIT_MESSAGE,
   standardHeaders: true,
-  legacyHeaders: false
+  legacyHeaders: false,
+  store: rateLimitStore
 });
 
 app.use('/api/', limiter);
 app.use(express.json({ limit: '10mb' }));
+
+// The limiter counts a batch request once, so charge it for each further
+// render too; otherwise batching would multiply the per-IP render budget
+app.post('/api/v1/states/maps', async (req, res, next) => {
+  try {
+    const renders = Array.isArray(req.body?.renders) ? Math.min(req.body.renders.length, 16) : 0;
+    let totalHits = 0;
+    for (let i = 1; i < renders; i++) {
+      ({ totalHits } = await rateLimitStore.increment(req.ip!));
+    }
+    if (totalHits > RATE_LIMIT_MAX) {
+      res.status(429).send(RATE_LIMIT_MESSAGE);
+      return;
+    }
+    next();
+  } catch (error) {
+    next(error);
+  }
+});
 app.use(express.urlencoded({ extended: true, limit: '10mb' }));
 app.use(express.static(join(__dirname, '..', 'public')));
 
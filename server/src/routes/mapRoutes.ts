@@ -22,4 +22,34 @@ const controller = new MapController();
  */
 router.post('/map', (req, res) => controller.generateStatesMap(req, res));
 
+/**
+ * POST /api/v1/states/maps
+ * Generate several state-level maps from one dataset in a single request
+ *
+ * Request body:
+ * {
+ *   ...same fields as /map,
+ *   renders: [{ colorScale?: string, mainTitle?: string }]  // 1-16 entries
+ * }
+ *
+ * Response: { success, maps: [{ colorScale, exports }], metadata }
+ *
+ * Each render counts as one request against the API rate limit.
+ */
+router.post('/maps', (req, res) => controller.generateStatesMaps(req, res));
+
+/**
+ * POST /api/v1/states/metadata
+ * Compute statistics for a dataset without rendering a map
+ *
+ * Request body:
+ * {
+ *   data: [{ state: string, value: number }],
+ *   colorScale?: string
+ * }
+ *
+ * Response: { success, metadata: { dataPoints, colorScale, minValue, maxValue, meanValue } }
+ */
+router.post('/metadata', (req, res) => controller.getStatesMetadata(req, res));
+
 export default router;
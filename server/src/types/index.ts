@@ -41,6 +41,25 @@ export const StatesMapRequestSchema = z.object({
 
 export type StatesMapRequest = z.infer<typeof StatesMapRequestSchema>;
 
+// Batch request: one dataset rendered once per entry in `renders`, each entry
+// overriding the color scale and/or title of the shared options
+export const StatesMapsRequestSchema = StatesMapRequestSchema.extend({
+  renders: z.array(z.object({
+    colorScale: z.enum(ColorScales).optional(),
+    mainTitle: z.string().optional()
+  })).min(1, 'At least one render is required').max(16, 'At most 16 renders per request')
+});
+
+export type StatesMapsRequest = z.infer<typeof StatesMapsRequestSchema>;
+
+// Metadata-only request: statistics for a dataset without rendering a map
+export const StatesMetadataRequestSchema = StatesMapRequestSchema.pick({
+  data: true,
+  colorScale: true
+});
+
+export type StatesMetadataRequest = z.infer<typeof StatesMetadataRequestSchema>;
+
 // Districts map types
 export const DistrictMapTypes = ['LGD', 'NFHS5', 'NFHS4'] as const;
 export type DistrictMapType = typeof DistrictMapTypes[number];
@@ -140,6 +159,20 @@ export interface StatesMapResponse {
   };
 }
 
+export interface StatesMapsResponse {
+  success: boolean;
+  maps: Array<{
+    colorScale: string;
+    exports: MapExportResult[];
+  }>;
+  metadata: Omit<StatesMapResponse['metadata'], 'colorScale'>;
+}
+
+export interface StatesMetadataResponse {
+  success: boolean;
+  metadata: StatesMapResponse['metadata'];
+}
+
 export interface ErrorResponse {
   success: false;
   error: {